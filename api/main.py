@@ -6,22 +6,85 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Iterable
+from functools import lru_cache
 import shutil
+import hashlib
+import json
+import threading
+import uuid
 from pathlib import Path
+import aiofiles
+from cachetools import TTLCache
+import atexit
+import logging
+import logging.handlers
+import queue
+
+from api.semantic_cache import SemanticCache
+from src.prompts import DEFAULT_SUMMARY_QUERY, DEFAULT_DEFINITIONS_QUERY
+
+
+def setup_logging() -> logging.Logger:
+    """Log through a queue so request handlers never block on stdout
+    
+    The ``src`` package logs through the same queue as the API.
+    """
+    logger = logging.getLogger("api")
+    if logger.handlers:
+        return logger
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for name in ("api", "src"):
+        named_logger = logging.getLogger(name)
+        named_logger.addHandler(queue_handler)
+        named_logger.setLevel(logging.INFO)
+        named_logger.propagate = False
+    return logger
+
+
+log = setup_logging()
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to ujson or the stdlib"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        if ujson is not None:
+            return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
+        return super().render(content)
 
-from src.ingestion import DocumentIngestion
-from src.rag import RAGSystem
-from src.quiz_generator import QuizGenerator
 
 # Initialize FastAPI
 app = FastAPI(
     title="AI Study Assistant API",
     description="RAG-powered study assistant using Ollama (100% FREE)",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware for frontend
@@ -34,27 +97,161 @@ app.add_middleware(
 )
 
 # Global instances
-ingestion = DocumentIngestion()
 vector_store = None
 rag_system = None
 quiz_generator = None
 
+# Generated quizzes keyed by quiz_id, so grading doesn't resend the questions
+quiz_cache = TTLCache(maxsize=1024, ttl=3600)
+quiz_cache_lock = threading.Lock()
+
+# Embeddings of the fixed default queries, computed once per process
+default_query_embeddings: Dict[str, List[float]] = {}
+
+# Semantic caches for RAG responses, one per endpoint + retrieval settings
+semantic_caches: Dict[str, SemanticCache] = {}
+
 UPLOAD_DIR = os.path.join(parent_dir, "data", "uploads")
 VECTOR_STORE_NAME = "study_materials"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".txt"})
+# Maps SHA-256 of each ingested file to its filename and chunk count
+UPLOAD_MANIFEST_PATH = os.path.join(parent_dir, "data", "upload_manifest.json")
+upload_manifest_lock = threading.Lock()
+# Uploads are staged outside UPLOAD_DIR until they are known not to be duplicates
+UPLOAD_STAGING_DIR = os.path.join(parent_dir, "data")
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
+def get_ingestion():
+    """Create the shared DocumentIngestion instance on first use"""
+    # Imported here so LangChain/Chroma only load when a document is ingested
+    from src.ingestion import DocumentIngestion
+    return DocumentIngestion()
+
+
+def read_upload_manifest() -> Dict[str, Dict]:
+    """Read the manifest of already-ingested files"""
+    try:
+        with open(UPLOAD_MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def update_upload_manifest(file_hash: str, entry: Optional[Dict]):
+    """Merge one entry into the manifest on disk, or drop it when entry is None
+    
+    The manifest is re-read under a lock so concurrent uploads keep each
+    other's entries, and replaced atomically so it is never half-written.
+    """
+    with upload_manifest_lock:
+        manifest = read_upload_manifest()
+        if entry is None:
+            manifest.pop(file_hash, None)
+        else:
+            manifest[file_hash] = entry
+        
+        tmp_path = UPLOAD_MANIFEST_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, UPLOAD_MANIFEST_PATH)
+
+
+def embed_query(text: str) -> List[float]:
+    """Embed a query, memoizing the embeddings of the fixed default queries"""
+    if text in (DEFAULT_SUMMARY_QUERY, DEFAULT_DEFINITIONS_QUERY):
+        vec = default_query_embeddings.get(text)
+        if vec is None:
+            vec = default_query_embeddings.setdefault(text, get_ingestion().embeddings.embed_query(text))
+        return vec
+    return get_ingestion().embeddings.embed_query(text)
+
+
+def get_semantic_cache(namespace: str, dim: int) -> SemanticCache:
+    """Get (or create) the semantic cache for an endpoint namespace"""
+    cache = semantic_caches.get(namespace)
+    if cache is None:
+        cache = semantic_caches.setdefault(namespace, SemanticCache(dim))
+    return cache
+
+
+def clear_semantic_caches():
+    """Invalidate cached responses after the document set changes"""
+    for cache in semantic_caches.values():
+        cache.clear()
+
+
+def attach_vector_store(store):
+    """Point the RAG and quiz systems at the current vector store"""
+    from src.rag import RAGSystem
+    from src.quiz_generator import QuizGenerator
+
+    global rag_system, quiz_generator
+    
+    if rag_system is None:
+        rag_system = RAGSystem(store)
+    else:
+        rag_system.set_vector_store(store)
+    
+    if quiz_generator is None:
+        quiz_generator = QuizGenerator(store)
+    else:
+        quiz_generator.set_vector_store(store)
+    
+    clear_semantic_caches()
+
+
+def sse_event(data: Dict, event: str) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream_rag_events(events: Iterable[Dict], text_key: str,
+                      cache: Optional[SemanticCache] = None, query_vec=None):
+    """Relay RAG stream output as server-sent events, caching the full result"""
+    result = {text_key: "", "sources": []}
+    tokens = []
+    
+    try:
+        for event in events:
+            if "sources" in event:
+                result["sources"] = event["sources"]
+                yield sse_event({"sources": event["sources"]}, "sources")
+            else:
+                tokens.append(event["token"])
+                yield sse_event({"token": event["token"]}, "token")
+    except Exception as e:
+        log.error("✗ Streaming failed: %s", e)
+        yield sse_event({"detail": str(e)}, "error")
+        return
+    
+    result[text_key] = "".join(tokens)
+    if cache is not None:
+        cache.put(query_vec, result)
+    yield sse_event({}, "done")
+
+
+def stream_cached(cached: Dict, text_key: str) -> StreamingResponse:
+    """Replay a cached result in the streaming event format"""
+    events = [{"sources": cached["sources"]}, {"token": cached[text_key]}]
+    return StreamingResponse(stream_rag_events(events, text_key), media_type="text/event-stream")
+
+
 # Pydantic models for request validation
 class QuestionRequest(BaseModel):
     question: str
     k: int = 5
+    stream: bool = False
 
 
 class SummarizeRequest(BaseModel):
     topic: Optional[str] = None
     summary_type: str = "bullets"
     k: int = 10
+    stream: bool = False
 
 
 class QuizRequest(BaseModel):
@@ -64,8 +261,9 @@ class QuizRequest(BaseModel):
 
 
 class GradeQuizRequest(BaseModel):
-    questions: List[Dict]
-    user_answers: Dict[int, str]
+    quiz_id: str
+    answers: List[str]
+    question_indices: Optional[List[int]] = None
 
 
 # API Endpoints
@@ -85,43 +283,69 @@ def root():
             "definitions": "/definitions",
             "quiz_generate": "/quiz/generate",
             "quiz_grade": "/quiz/grade",
-            "documents": "/documents"
+            "documents": "/documents",
+            "cache_stats": "/cache/stats"
         }
     }
 
 
 @app.post("/upload")
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(file: UploadFile = File(...), ingestion=Depends(get_ingestion)):
     """Upload and process a document (PDF or TXT)"""
-    global vector_store, rag_system, quiz_generator
+    global vector_store
     
+    staging_path = os.path.join(UPLOAD_STAGING_DIR, f".upload-{uuid.uuid4().hex}.part")
     try:
-        print(f"\n{'='*60}")
-        print(f"FILE UPLOAD REQUEST")
-        print(f"{'='*60}")
-        print(f"Filename: {file.filename}")
-        print(f"Content Type: {file.content_type}")
+        log.info("[UPLOAD REQUEST] Filename: %s, Content Type: %s", file.filename, file.content_type)
         
         # Validate file type
         file_extension = Path(file.filename).suffix.lower()
-        if file_extension not in ['.pdf', '.txt']:
+        if file_extension not in ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Unsupported file type: {file_extension}. Only .pdf and .txt are supported."
             )
         
-        # Save uploaded file
+        # Stage uploaded file, hashing it as it streams in
         file_path = os.path.join(UPLOAD_DIR, file.filename)
-        print(f"Saving to: {file_path}")
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        digest = hashlib.sha256()
+        async with aiofiles.open(staging_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await buffer.write(chunk)
+        file_hash = digest.hexdigest()
+        
+        log.info("✓ File received (sha256: %s)", file_hash[:12])
+        
+        # Skip re-embedding files that are already in the vector store; the
+        # staged copy is discarded so the uploads folder holds no duplicates
+        entry = read_upload_manifest().get(file_hash)
+        if entry is not None:
+            try:
+                if vector_store is None:
+                    vector_store = await run_in_threadpool(ingestion.load_vector_store, VECTOR_STORE_NAME)
+                    attach_vector_store(vector_store)
+                
+                log.info("✓ Already processed as %s, skipping embedding", entry["filename"])
+                
+                return {
+                    "message": f"Document already processed as {entry['filename']}",
+                    "filename": file.filename,
+                    "duplicate_of": entry["filename"],
+                    "chunks_created": entry["chunks"],
+                    "status": "success"
+                }
+            except FileNotFoundError:
+                log.warning("Vector store missing, reprocessing document...")
+                update_upload_manifest(file_hash, None)
         
-        print(f"✓ File saved")
+        os.replace(staging_path, file_path)
+        log.info("Saved to: %s", file_path)
         
         # Process document
-        print("Processing document...")
-        chunks = ingestion.process_documents(file_path)
+        log.info("Processing document...")
+        chunks = await run_in_threadpool(ingestion.process_documents, file_path)
         
         if not chunks:
             raise HTTPException(
@@ -129,29 +353,39 @@ async def upload_document(file: UploadFile = File(...)):
                 detail="Failed to extract content from document"
             )
         
-        # Create or update vector store
+        # Embed all chunks in batches, then create or update vector store
         try:
+            log.info("Embedding %d chunks...", len(chunks))
+            embeddings = await run_in_threadpool(
+                ingestion.embed_batch, [chunk.page_content for chunk in chunks]
+            )
+            
             if vector_store is None:
-                print("Creating new vector store...")
-                vector_store = ingestion.create_vector_store(chunks, VECTOR_STORE_NAME)
+                log.info("Creating new vector store...")
+                vector_store = await run_in_threadpool(
+                    ingestion.create_vector_store, chunks, VECTOR_STORE_NAME, embeddings=embeddings
+                )
             else:
-                print("Updating existing vector store...")
-                ingestion.add_documents_to_existing_store(chunks, VECTOR_STORE_NAME)
-                vector_store = ingestion.load_vector_store(VECTOR_STORE_NAME)
+                log.info("Updating existing vector store...")
+                # Append to the resident store; Chroma persists the new rows itself
+                vector_store = await run_in_threadpool(
+                    ingestion.add_documents_to_existing_store, chunks, VECTOR_STORE_NAME,
+                    embeddings=embeddings, vector_store=vector_store
+                )
         except Exception as e:
-            print(f"Vector store error: {str(e)}")
+            log.error("Vector store error: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to create/update vector store: {str(e)}"
             )
         
-        # Initialize RAG and Quiz systems
-        print("Initializing RAG and Quiz systems...")
-        rag_system = RAGSystem(vector_store)
-        quiz_generator = QuizGenerator(vector_store)
+        # Initialize RAG and Quiz systems, or hand them the updated store
+        log.info("Updating RAG and Quiz systems...")
+        attach_vector_store(vector_store)
+        
+        update_upload_manifest(file_hash, {"filename": file.filename, "chunks": len(chunks)})
         
-        print(f"✓ Upload complete!")
-        print(f"{'='*60}\n")
+        log.info("✓ Upload complete!")
         
         return {
             "message": "Document uploaded and processed successfully",
@@ -163,8 +397,11 @@ async def upload_document(file: UploadFile = File(...)):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Upload failed: {str(e)}")
+        log.error("✗ Upload failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
 
 
 @app.post("/ask")
@@ -177,12 +414,30 @@ def ask_question(request: QuestionRequest):
         )
     
     try:
-        print(f"\n[Q&A REQUEST] {request.question}")
-        result = rag_system.ask_question(request.question, k=request.k)
-        print(f"[Q&A RESPONSE] Generated answer with {len(result['sources'])} sources")
+        log.info("[Q&A REQUEST] %s", request.question)
+        query_vec = embed_query(request.question)
+        cache = get_semantic_cache(f"ask:k={request.k}", len(query_vec))
+        cached = cache.get(query_vec)
+        if cached is not None:
+            log.info("[Q&A RESPONSE] Served from semantic cache")
+            return stream_cached(cached, "answer") if request.stream else cached
+        
+        if request.stream:
+            log.info("[Q&A RESPONSE] Streaming answer")
+            return StreamingResponse(
+                stream_rag_events(
+                    rag_system.ask_question_stream(request.question, k=request.k, query_vec=query_vec),
+                    "answer", cache, query_vec
+                ),
+                media_type="text/event-stream"
+            )
+        
+        result = rag_system.ask_question(request.question, k=request.k, query_vec=query_vec)
+        cache.put(query_vec, result)
+        log.info("[Q&A RESPONSE] Generated answer with %d sources", len(result["sources"]))
         return result
     except Exception as e:
-        print(f"✗ Q&A failed: {str(e)}")
+        log.error("✗ Q&A failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Question answering failed: {str(e)}")
 
 
@@ -196,21 +451,45 @@ def summarize(request: SummarizeRequest):
         )
     
     try:
-        print(f"\n[SUMMARY REQUEST] Type: {request.summary_type}, Topic: {request.topic}")
+        log.info("[SUMMARY REQUEST] Type: %s, Topic: %s", request.summary_type, request.topic)
+        query_vec = embed_query(request.topic or DEFAULT_SUMMARY_QUERY)
+        cache = get_semantic_cache(f"summarize:{request.summary_type}:k={request.k}", len(query_vec))
+        cached = cache.get(query_vec)
+        if cached is not None:
+            log.info("[SUMMARY RESPONSE] Served from semantic cache")
+            return stream_cached(cached, "summary") if request.stream else cached
+        
+        if request.stream:
+            log.info("[SUMMARY RESPONSE] Streaming summary")
+            return StreamingResponse(
+                stream_rag_events(
+                    rag_system.summarize_stream(
+                        query=request.topic,
+                        summary_type=request.summary_type,
+                        k=request.k,
+                        query_vec=query_vec
+                    ),
+                    "summary", cache, query_vec
+                ),
+                media_type="text/event-stream"
+            )
+        
         result = rag_system.summarize(
             query=request.topic,
             summary_type=request.summary_type,
-            k=request.k
+            k=request.k,
+            query_vec=query_vec
         )
-        print(f"[SUMMARY RESPONSE] Generated from {len(result['sources'])} sources")
+        cache.put(query_vec, result)
+        log.info("[SUMMARY RESPONSE] Generated from %d sources", len(result["sources"]))
         return result
     except Exception as e:
-        print(f"✗ Summarization failed: {str(e)}")
+        log.error("✗ Summarization failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
 
 @app.post("/definitions")
-def get_definitions(topic: str = "definitions terms concepts"):
+def get_definitions(topic: str = DEFAULT_DEFINITIONS_QUERY):
     """Extract key definitions and terms from uploaded materials"""
     if rag_system is None:
         raise HTTPException(
@@ -219,12 +498,20 @@ def get_definitions(topic: str = "definitions terms concepts"):
         )
     
     try:
-        print(f"\n[DEFINITIONS REQUEST] Topic: {topic}")
-        result = rag_system.extract_definitions(query=topic)
-        print(f"[DEFINITIONS RESPONSE] Extracted from {len(result['sources'])} sources")
+        log.info("[DEFINITIONS REQUEST] Topic: %s", topic)
+        query_vec = embed_query(topic)
+        cache = get_semantic_cache("definitions", len(query_vec))
+        cached = cache.get(query_vec)
+        if cached is not None:
+            log.info("[DEFINITIONS RESPONSE] Served from semantic cache")
+            return cached
+        
+        result = rag_system.extract_definitions(query=topic, query_vec=query_vec)
+        cache.put(query_vec, result)
+        log.info("[DEFINITIONS RESPONSE] Extracted from %d sources", len(result["sources"]))
         return result
     except Exception as e:
-        print(f"✗ Definition extraction failed: {str(e)}")
+        log.error("✗ Definition extraction failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Definition extraction failed: {str(e)}")
 
 
@@ -238,7 +525,10 @@ def generate_quiz(request: QuizRequest):
         )
     
     try:
-        print(f"\n[QUIZ REQUEST] Topic: {request.topic}, Questions: {request.num_questions}, Difficulty: {request.difficulty}")
+        log.info(
+            "[QUIZ REQUEST] Topic: %s, Questions: %d, Difficulty: %s",
+            request.topic, request.num_questions, request.difficulty
+        )
         
         quiz = quiz_generator.generate_quiz(
             topic=request.topic,
@@ -249,13 +539,18 @@ def generate_quiz(request: QuizRequest):
         if "error" in quiz:
             raise HTTPException(status_code=500, detail=quiz["error"])
         
-        print(f"[QUIZ RESPONSE] Generated {len(quiz.get('questions', []))} questions")
+        quiz_id = uuid.uuid4().hex
+        with quiz_cache_lock:
+            quiz_cache[quiz_id] = quiz["questions"]
+        quiz["quiz_id"] = quiz_id
+        
+        log.info("[QUIZ RESPONSE] Generated %d questions (quiz_id: %s)", len(quiz.get("questions", [])), quiz_id)
         return quiz
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Quiz generation failed: {str(e)}")
+        log.error("✗ Quiz generation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Quiz generation failed: {str(e)}")
 
 
@@ -268,13 +563,27 @@ def grade_quiz(request: GradeQuizRequest):
             detail="No documents uploaded yet. Please upload documents first."
         )
     
+    if request.question_indices is not None and len(request.question_indices) != len(request.answers):
+        raise HTTPException(
+            status_code=400,
+            detail="question_indices and answers must have the same length"
+        )
+    
+    with quiz_cache_lock:
+        questions = quiz_cache.get(request.quiz_id)
+    if questions is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Quiz not found or expired. Please generate a new quiz."
+        )
+    
     try:
-        print(f"\n[QUIZ GRADING] Grading {len(request.questions)} questions")
-        results = quiz_generator.grade_quiz(request.questions, request.user_answers)
-        print(f"[QUIZ GRADING] Score: {results['score']}%")
+        log.info("[QUIZ GRADING] Grading %d questions (quiz_id: %s)", len(questions), request.quiz_id)
+        results = quiz_generator.grade_quiz(questions, request.answers, request.question_indices)
+        log.info("[QUIZ GRADING] Score: %s%%", results["score"])
         return results
     except Exception as e:
-        print(f"✗ Quiz grading failed: {str(e)}")
+        log.error("✗ Quiz grading failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Quiz grading failed: {str(e)}")
 
 
@@ -282,7 +591,8 @@ def grade_quiz(request: GradeQuizRequest):
 def list_documents():
     """List all uploaded documents"""
     try:
-        files = [f for f in os.listdir(UPLOAD_DIR) if os.path.isfile(os.path.join(UPLOAD_DIR, f))]
+        with os.scandir(UPLOAD_DIR) as entries:
+            files = [entry.name for entry in entries if entry.is_file()]
         return {
             "documents": files,
             "count": len(files)
@@ -291,6 +601,14 @@ def list_documents():
         raise HTTPException(status_code=500, detail=f"Failed to list documents: {str(e)}")
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    """Hit rate and size of the semantic response caches"""
+    return {
+        "caches": {name: cache.stats() for name, cache in semantic_caches.items()}
+    }
+
+
 @app.delete("/reset")
 def reset_system():
     """Reset the system (clear all data)"""
@@ -298,20 +616,29 @@ def reset_system():
     
     try:
         # Clear uploads
-        for file in os.listdir(UPLOAD_DIR):
-            file_path = os.path.join(UPLOAD_DIR, file)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
+        with os.scandir(UPLOAD_DIR) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
         
         # Clear vector store
         vector_store_path = os.path.join(parent_dir, "data", "vector_store", VECTOR_STORE_NAME)
         if os.path.exists(vector_store_path):
             shutil.rmtree(vector_store_path)
         
+        # Clear manifest of ingested files
+        with upload_manifest_lock:
+            if os.path.exists(UPLOAD_MANIFEST_PATH):
+                os.unlink(UPLOAD_MANIFEST_PATH)
+        
+        with quiz_cache_lock:
+            quiz_cache.clear()
+        
         # Reset globals
         vector_store = None
         rag_system = None
         quiz_generator = None
+        clear_semantic_caches()
         
         return {
             "message": "System reset successfully",
@@ -333,4 +660,4 @@ if __name__ == "__main__":
     print("API Docs: http://localhost:8000/docs")
     print("="*60 + "\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", access_log=False)
\ No newline at end of file
@@ -0,0 +1,227 @@
+import importlib.util
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def quantize(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization with a per-vector scale (vec ~= q * scale)"""
+    peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+    if peak == 0.0:
+        return np.zeros(vec.shape, dtype=np.int8), 0.0
+    q = np.round(vec * (127.0 / peak)).astype(np.int8)
+    return q, peak / 127.0
+
+
+@lru_cache(maxsize=None)
+def _load_kernels() -> Tuple[Callable, Callable]:
+    """Import Numba and compile the kernels on first use
+
+    Kept out of module import so loading the API doesn't pay for the JIT.
+    Kernels are serial: a lookup touches at most ``capacity`` rows, too few
+    for thread start-up to pay off inside an already threaded server.
+    """
+    from numba import njit
+
+    @njit(fastmath=True, cache=True)
+    def score_bucket(vectors, scales, bucket_of, n, q, q_scale, buckets, out):
+        """Cosine scores for int8 rows sharing a bucket with the query in any
+        table; other rows get -2 (below any cosine)"""
+        for i in range(n):
+            candidate = False
+            for t in range(buckets.shape[0]):
+                if bucket_of[i, t] == buckets[t]:
+                    candidate = True
+                    break
+            if candidate:
+                acc = np.int32(0)
+                for j in range(q.shape[0]):
+                    acc += np.int32(vectors[i, j]) * np.int32(q[j])
+                out[i] = acc * scales[i] * q_scale
+            else:
+                out[i] = -2.0
+
+    @njit(fastmath=True, cache=True)
+    def hash_signs(planes, q, out):
+        """Pack the projection signs of each table into its integer bucket key"""
+        num_bits = planes.shape[1]
+        for t in range(planes.shape[0]):
+            key = np.int64(0)
+            for p in range(num_bits):
+                acc = np.float32(0.0)
+                for j in range(q.shape[0]):
+                    acc += planes[t, p, j] * q[j]
+                if acc > 0:
+                    key |= np.int64(1) << p
+            out[t] = key
+
+    # Compile now so the first lookup doesn't pay for it
+    out = np.zeros(1, dtype=np.float32)
+    keys = np.zeros(1, dtype=np.int64)
+    score_bucket(np.zeros((1, 1), dtype=np.int8), out, np.zeros((1, 1), dtype=np.int64),
+                 1, np.zeros(1, dtype=np.int8), np.float32(1.0), keys, out)
+    hash_signs(np.zeros((1, 1, 1), dtype=np.float32), out, keys)
+    return score_bucket, hash_signs
+
+
+class SemanticCache:
+    """Similarity cache for RAG responses keyed by query embedding
+
+    Embeddings are L2-normalized, quantized to int8 with a per-row scale
+    and kept in a contiguous matrix. Rows are bucketed with
+    random-projection LSH in several independent tables; a row is a
+    candidate when it shares a bucket with the query in at least one table,
+    so near-duplicates that differ in a few sign bits still match, and a
+    lookup scores the candidates with a single matrix-vector product.
+    When Numba is installed, hashing and scoring run as JIT-compiled
+    kernels (compiled when the first cache is built) that skip rows
+    outside the query's buckets. Entries whose cosine
+    similarity with the query reaches ``threshold`` count as a hit.
+    Eviction is least-recently-used (SIM-LRU): a hit refreshes the entry.
+    """
+
+    def __init__(self, dim: int, threshold: float = 0.95, capacity: int = 1024,
+                 num_tables: int = 8, num_bits: int = 6, seed: int = 0, initial_size: int = 64,
+                 use_numba: bool = NUMBA_AVAILABLE):
+        self.dim = dim
+        self.threshold = threshold
+        self.capacity = capacity
+        self.use_numba = use_numba and NUMBA_AVAILABLE
+        if self.use_numba:
+            self._score_bucket, self._hash_signs = _load_kernels()
+        if not 0 < num_bits < 64:
+            raise ValueError("num_bits must be between 1 and 63")
+        self.num_tables = num_tables
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((num_tables, num_bits, dim)).astype(np.float32)
+        self._bit_weights = 1 << np.arange(num_bits, dtype=np.int64)
+
+        # Structure-of-arrays storage: rows [0, _size) are occupied
+        self._initial_size = max(1, min(initial_size, capacity))
+        self._allocate(self._initial_size)
+        self._values: list = []
+        self._size = 0
+
+        # slot -> None, ordered from least to most recently used
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _allocate(self, rows: int) -> None:
+        """(Re)allocate row storage, keeping the occupied rows"""
+        vectors = np.zeros((rows, self.dim), dtype=np.int8)
+        scales = np.zeros(rows, dtype=np.float32)
+        bucket_of = np.zeros((rows, self.num_tables), dtype=np.int64)
+        if getattr(self, "_size", 0):
+            n = self._size
+            vectors[:n] = self._vectors[:n]
+            scales[:n] = self._scales[:n]
+            bucket_of[:n] = self._bucket_of[:n]
+        self._vectors, self._scales, self._bucket_of = vectors, scales, bucket_of
+        self._scores = np.zeros(rows, dtype=np.float32)
+
+    def _normalize(self, vec) -> np.ndarray:
+        vec = np.asarray(vec, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of dim {self.dim}, got {vec.shape[0]}")
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def _hash(self, vec: np.ndarray) -> np.ndarray:
+        """Bucket key of ``vec`` in each LSH table"""
+        if self.use_numba:
+            keys = np.empty(self.num_tables, dtype=np.int64)
+            self._hash_signs(self._planes, vec, keys)
+            return keys
+        bits = (self._planes @ vec) > 0
+        return bits @ self._bit_weights
+
+    def get(self, vec) -> Optional[Any]:
+        """Return the cached value for the closest query, or None on a miss"""
+        q = self._normalize(vec)
+        bucket = self._hash(q)
+        q_int8, q_scale = quantize(q)
+
+        with self._lock:
+            n = self._size
+            if n == 0:
+                self.misses += 1
+                return None
+
+            if self.use_numba:
+                scores = self._scores[:n]
+                self._score_bucket(self._vectors, self._scales, self._bucket_of, n,
+                                   q_int8, np.float32(q_scale), bucket, scores)
+                best_slot = int(np.argmax(scores))
+                best_score = scores[best_slot]
+            else:
+                # Only rows sharing a bucket with the query are scored
+                candidates = np.flatnonzero((self._bucket_of[:n] == bucket).any(axis=1))
+                if candidates.size == 0:
+                    self.misses += 1
+                    return None
+                # int32 accumulation: int8 products overflow int16 for typical dims
+                dots = self._vectors[candidates].astype(np.int32) @ q_int8.astype(np.int32)
+                scores = dots * self._scales[candidates] * np.float32(q_scale)
+                best = int(np.argmax(scores))
+                best_slot, best_score = int(candidates[best]), scores[best]
+
+            if best_score < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._lru.move_to_end(best_slot)
+            return self._values[best_slot]
+
+    def put(self, vec, value: Any) -> None:
+        """Store a value for a query embedding, evicting the LRU entry if full"""
+        q = self._normalize(vec)
+        bucket = self._hash(q)
+        q_int8, q_scale = quantize(q)
+
+        with self._lock:
+            if self._size < self.capacity:
+                if self._size == self._vectors.shape[0]:
+                    self._allocate(min(self._vectors.shape[0] * 2, self.capacity))
+                slot = self._size
+                self._size += 1
+                self._values.append(value)
+            else:
+                slot, _ = self._lru.popitem(last=False)
+                self._values[slot] = value
+
+            self._vectors[slot] = q_int8
+            self._scales[slot] = q_scale
+            self._bucket_of[slot] = bucket
+            self._lru[slot] = None
+
+    def clear(self) -> None:
+        """Drop all cached entries (e.g. after the document set changes)"""
+        with self._lock:
+            self._size = 0
+            self._allocate(self._initial_size)
+            self._values = []
+            self._lru.clear()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for monitoring"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
@@ -1,7 +1,7 @@
 import streamlit as st
 import requests
 import json
-from typing import Dict, List
+from typing import List
 import time
 
 # API Configuration
@@ -116,15 +116,21 @@ def generate_quiz(topic: str, num_questions: int, difficulty: str):
     return response.json()
 
 
-def grade_quiz(questions: List[Dict], user_answers: Dict[int, str]):
+def grade_quiz(quiz_id: str, answers: List[str]):
     """Grade quiz"""
     response = requests.post(
         f"{API_URL}/quiz/grade",
         json={
-            "questions": questions,
-            "user_answers": user_answers
+            "quiz_id": quiz_id,
+            "answers": answers
         }
     )
+    if not response.ok:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        return {"error": detail, "status_code": response.status_code}
     return response.json()
 
 
@@ -355,7 +361,7 @@ def main():
             
             st.divider()
             
-            user_answers = {}
+            user_answers = []
             
             for i, q in enumerate(quiz_data['questions']):
                 st.markdown(f"**Question {i+1} of {len(quiz_data['questions'])}**")
@@ -371,47 +377,54 @@ def main():
                     label_visibility="collapsed"
                 )
                 
-                user_answers[i] = answer
+                user_answers.append(answer)
                 st.divider()
             
             if st.button("✅ Submit Quiz", use_container_width=True, type="primary"):
                 with st.spinner("Grading your quiz..."):
                     try:
-                        results = grade_quiz(quiz_data['questions'], user_answers)
+                        results = grade_quiz(quiz_data['quiz_id'], user_answers)
                         
-                        # Show score
-                        score = results['score']
-                        if score >= 80:
-                            st.balloons()
-                            st.success(f"🎉 Excellent! Score: {score}% ({results['correct']}/{results['total']})")
-                        elif score >= 60:
-                            st.info(f"👍 Good job! Score: {score}% ({results['correct']}/{results['total']})")
+                        if 'error' in results:
+                            st.error(f"❌ Grading failed: {results['error']}")
+                            if results['status_code'] == 404:
+                                # Quiz expired on the server, so it can't be graded any more
+                                del st.session_state['current_quiz']
+                                st.info("Please generate a new quiz.")
                         else:
-                            st.warning(f"📚 Keep studying! Score: {score}% ({results['correct']}/{results['total']})")
-                        
-                        # Detailed results
-                        with st.expander("📊 View Detailed Results", expanded=True):
-                            for result in results['results']:
-                                is_correct = result['is_correct']
-                                icon = "✅" if is_correct else "❌"
-                                
-                                st.markdown(f"{icon} **Question {result['question_number']}:** {result['question']}")
-                                
-                                col1, col2 = st.columns(2)
-                                with col1:
-                                    st.write(f"**Your answer:** {result['user_answer']}")
-                                with col2:
-                                    st.write(f"**Correct answer:** {result['correct_answer']}")
-                                
-                                if not is_correct:
-                                    st.info(f"💡 **Explanation:** {result['explanation']}")
-                                
-                                st.divider()
-                        
-                        # Clear quiz after submission
-                        if st.button("🔄 Take Another Quiz"):
-                            del st.session_state['current_quiz']
-                            st.rerun()
+                            # Show score
+                            score = results['score']
+                            if score >= 80:
+                                st.balloons()
+                                st.success(f"🎉 Excellent! Score: {score}% ({results['correct']}/{results['total']})")
+                            elif score >= 60:
+                                st.info(f"👍 Good job! Score: {score}% ({results['correct']}/{results['total']})")
+                            else:
+                                st.warning(f"📚 Keep studying! Score: {score}% ({results['correct']}/{results['total']})")
+                            
+                            # Detailed results
+                            with st.expander("📊 View Detailed Results", expanded=True):
+                                for result in results['results']:
+                                    is_correct = result['is_correct']
+                                    icon = "✅" if is_correct else "❌"
+                                    
+                                    st.markdown(f"{icon} **Question {result['question_number']}:** {result['question']}")
+                                    
+                                    col1, col2 = st.columns(2)
+                                    with col1:
+                                        st.write(f"**Your answer:** {result['user_answer']}")
+                                    with col2:
+                                        st.write(f"**Correct answer:** {result['correct_answer']}")
+                                    
+                                    if not is_correct:
+                                        st.info(f"💡 **Explanation:** {result['explanation']}")
+                                    
+                                    st.divider()
+                            
+                            # Clear quiz after submission
+                            if st.button("🔄 Take Another Quiz"):
+                                del st.session_state['current_quiz']
+                                st.rerun()
                             
                     except Exception as e:
                         st.error(f"❌ Grading failed: {str(e)}")
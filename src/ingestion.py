@@ -1,7 +1,11 @@
+import logging
 import os
-from typing import List, Dict
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from pathlib import Path
 import pypdf
+from chromadb.utils.batch_utils import create_batches
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 from langchain_community.embeddings import OllamaEmbeddings
@@ -9,6 +13,9 @@ from langchain_community.vectorstores import Chroma
 import json
 
 
+log = logging.getLogger(__name__)
+
+
 class DocumentIngestion:
     """Handles document upload, processing, and indexing with Ollama"""
     
@@ -16,7 +23,7 @@ class DocumentIngestion:
         self.vector_store_path = vector_store_path
         
         # Initialize Ollama embeddings
-        print("Initializing Ollama embeddings...")
+        log.info("Initializing Ollama embeddings...")
         self.embeddings = OllamaEmbeddings(
             model="nomic-embed-text",
             base_url="http://localhost:11434"
@@ -35,14 +42,14 @@ class DocumentIngestion:
         documents = []
         
         try:
-            print(f"Extracting text from {pdf_path}...")
+            log.info("Extracting text from %s...", pdf_path)
             with open(pdf_path, 'rb') as file:
                 pdf_reader = pypdf.PdfReader(file)
                 filename = Path(pdf_path).name
                 total_pages = len(pdf_reader.pages)
                 
                 for page_num, page in enumerate(pdf_reader.pages, start=1):
-                    print(f"  Processing page {page_num}/{total_pages}...", end='\r')
+                    log.debug("Processing page %d/%d...", page_num, total_pages)
                     text = page.extract_text()
                     
                     if text.strip():
@@ -55,22 +62,22 @@ class DocumentIngestion:
                             }
                         })
                 
-                print(f"\n✓ Extracted {len(documents)} pages from {filename}")
+                log.info("✓ Extracted %d pages from %s", len(documents), filename)
                         
         except Exception as e:
-            print(f"✗ Error extracting PDF {pdf_path}: {str(e)}")
+            log.error("✗ Error extracting PDF %s: %s", pdf_path, e)
             
         return documents
     
     def extract_text_from_txt(self, txt_path: str) -> List[Dict]:
         """Extract text from plain text file"""
         try:
-            print(f"Reading text file {txt_path}...")
+            log.info("Reading text file %s...", txt_path)
             with open(txt_path, 'r', encoding='utf-8') as file:
                 text = file.read()
                 filename = Path(txt_path).name
                 
-                print(f"✓ Read {len(text)} characters from {filename}")
+                log.info("✓ Read %d characters from %s", len(text), filename)
                 return [{
                     'content': text,
                     'metadata': {
@@ -79,7 +86,7 @@ class DocumentIngestion:
                     }
                 }]
         except Exception as e:
-            print(f"✗ Error reading text file {txt_path}: {str(e)}")
+            log.error("✗ Error reading text file %s: %s", txt_path, e)
             return []
     
     def clean_text(self, text: str) -> str:
@@ -93,9 +100,7 @@ class DocumentIngestion:
     
     def process_documents(self, file_path: str) -> List[Document]:
         """Process a document into chunks"""
-        print(f"\n{'='*50}")
-        print(f"Processing: {file_path}")
-        print(f"{'='*50}")
+        log.info("Processing: %s", file_path)
         
         file_extension = Path(file_path).suffix.lower()
         
@@ -111,7 +116,7 @@ class DocumentIngestion:
             raise ValueError("No content extracted from document")
         
         # Clean and create LangChain documents
-        print("Cleaning text...")
+        log.info("Cleaning text...")
         documents = []
         for doc in raw_docs:
             cleaned_text = self.clean_text(doc['content'])
@@ -121,39 +126,79 @@ class DocumentIngestion:
                     metadata=doc['metadata']
                 ))
         
-        print(f"✓ Created {len(documents)} clean documents")
+        log.info("✓ Created %d clean documents", len(documents))
         
         # Split into chunks
-        print("Splitting into chunks...")
+        log.info("Splitting into chunks...")
         chunks = self.text_splitter.split_documents(documents)
         
-        print(f"✓ Created {len(chunks)} chunks")
-        print(f"{'='*50}\n")
+        log.info("✓ Created %d chunks", len(chunks))
         
         return chunks
     
-    def create_vector_store(self, documents: List[Document], store_name: str = "default"):
-        """Create Chroma vector store from documents"""
+    def embed_batch(self, texts: List[str], batch_size: int = 64, max_workers: int = 4) -> List[List[float]]:
+        """Embed document texts in batches sent to Ollama concurrently
+        
+        Each batch goes through ``embeddings.embed_documents`` so the vectors
+        are identical to the ones LangChain would store (same instruction
+        prefix, endpoint and normalization as existing chunks).
+        """
+        batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+        
+        log.info("Embedding %d chunks in %d batches...", len(texts), len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            vectors = [vec for batch in pool.map(self.embeddings.embed_documents, batches) for vec in batch]
+        
+        log.info("✓ Embedded %d chunks", len(vectors))
+        return vectors
+    
+    def _add_embedded_documents(self, vector_store: Chroma, documents: List[Document],
+                                embeddings: List[List[float]]):
+        """Insert documents with precomputed embeddings, skipping re-embedding"""
+        # Split into chunks of the client's max batch size, as LangChain's from_texts does
+        for ids, batch_embeddings, metadatas, texts in create_batches(
+            api=vector_store._client,
+            ids=[str(uuid.uuid4()) for _ in documents],
+            embeddings=embeddings,
+            metadatas=[doc.metadata for doc in documents],
+            documents=[doc.page_content for doc in documents]
+        ):
+            vector_store._collection.add(
+                ids=ids,
+                embeddings=batch_embeddings,
+                metadatas=metadatas,
+                documents=texts
+            )
+    
+    def create_vector_store(self, documents: List[Document], store_name: str = "default",
+                            embeddings: Optional[List[List[float]]] = None):
+        """Create Chroma vector store from documents (optionally pre-embedded)"""
         if not documents:
             raise ValueError("No documents to index")
         
-        print(f"\n{'='*50}")
-        print(f"Creating Vector Store: {store_name}")
-        print(f"{'='*50}")
+        log.info("Creating Vector Store: %s", store_name)
         
         store_path = os.path.join(self.vector_store_path, store_name)
         os.makedirs(store_path, exist_ok=True)
         
-        print(f"Generating embeddings for {len(documents)} chunks...")
-        print("This may take a few minutes...")
-        
-        # Create vector store with Ollama embeddings
-        vector_store = Chroma.from_documents(
-            documents=documents,
-            embedding=self.embeddings,
-            persist_directory=store_path,
-            collection_name=store_name
-        )
+        if embeddings is not None:
+            log.info("Indexing %d pre-embedded chunks...", len(documents))
+            vector_store = Chroma(
+                persist_directory=store_path,
+                embedding_function=self.embeddings,
+                collection_name=store_name
+            )
+            self._add_embedded_documents(vector_store, documents, embeddings)
+        else:
+            log.info("Generating embeddings for %d chunks, this may take a few minutes...", len(documents))
+            
+            # Create vector store with Ollama embeddings
+            vector_store = Chroma.from_documents(
+                documents=documents,
+                embedding=self.embeddings,
+                persist_directory=store_path,
+                collection_name=store_name
+            )
         
         # Save metadata
         metadata = {
@@ -165,9 +210,8 @@ class DocumentIngestion:
         with open(os.path.join(store_path, 'metadata.json'), 'w') as f:
             json.dump(metadata, f, indent=2)
         
-        print(f"✓ Vector store created at: {store_path}")
-        print(f"✓ Indexed {len(documents)} document chunks")
-        print(f"{'='*50}\n")
+        log.info("✓ Vector store created at: %s", store_path)
+        log.info("✓ Indexed %d document chunks", len(documents))
         
         return vector_store
     
@@ -178,7 +222,7 @@ class DocumentIngestion:
         if not os.path.exists(store_path):
             raise FileNotFoundError(f"Vector store not found at {store_path}")
         
-        print(f"Loading vector store from {store_path}...")
+        log.info("Loading vector store from %s...", store_path)
         
         vector_store = Chroma(
             persist_directory=store_path,
@@ -186,22 +230,32 @@ class DocumentIngestion:
             collection_name=store_name
         )
         
-        print(f"✓ Vector store loaded")
+        log.info("✓ Vector store loaded")
         return vector_store
     
-    def add_documents_to_existing_store(self, documents: List[Document], store_name: str = "default"):
-        """Add new documents to existing vector store"""
+    def add_documents_to_existing_store(self, documents: List[Document], store_name: str = "default",
+                                        embeddings: Optional[List[List[float]]] = None,
+                                        vector_store: Optional[Chroma] = None):
+        """Add new documents (optionally pre-embedded) to existing vector store
+        
+        Pass an already loaded ``vector_store`` to append to it in place
+        instead of reopening the store from disk. Returns the updated store.
+        """
         try:
-            print("Loading existing vector store...")
-            vector_store = self.load_vector_store(store_name)
+            if vector_store is None:
+                log.info("Loading existing vector store...")
+                vector_store = self.load_vector_store(store_name)
             
-            print(f"Adding {len(documents)} new documents...")
-            vector_store.add_documents(documents)
+            log.info("Adding %d new documents...", len(documents))
+            if embeddings is not None:
+                self._add_embedded_documents(vector_store, documents, embeddings)
+            else:
+                vector_store.add_documents(documents)
             
-            print("✓ Documents added successfully")
+            log.info("✓ Documents added successfully")
         except FileNotFoundError:
-            print("No existing store found. Creating new one...")
-            vector_store = self.create_vector_store(documents, store_name)
+            log.info("No existing store found. Creating new one...")
+            vector_store = self.create_vector_store(documents, store_name, embeddings=embeddings)
         
         return vector_store
 
@@ -1,5 +1,9 @@
 """Prompt templates optimized for Ollama models"""
 
+# Retrieval queries used when the user doesn't give a topic
+DEFAULT_SUMMARY_QUERY = "overview main concepts key topics"
+DEFAULT_DEFINITIONS_QUERY = "definitions terms concepts"
+
 QA_PROMPT_TEMPLATE = """You are a helpful tutoring assistant. Answer the student's question using ONLY the context provided below.
 
 Rules:
@@ -1,18 +1,22 @@
 import json
+import logging
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 from langchain_community.llms import Ollama
 from langchain_community.vectorstores import Chroma
 from src.prompts import QUIZ_GENERATION_PROMPT
 
 
+log = logging.getLogger(__name__)
+
+
 class QuizGenerator:
     """Generate quizzes from study materials using Ollama"""
     
     def __init__(self, vector_store: Chroma, model_name: str = "llama3.2"):
         self.vector_store = vector_store
         
-        print(f"Initializing Quiz Generator with {model_name}")
+        log.info("Initializing Quiz Generator with %s", model_name)
         
         self.llm = Ollama(
             model=model_name,
@@ -21,7 +25,11 @@ class QuizGenerator:
             num_predict=2048,  # Allow longer responses for multiple questions
         )
         
-        print("✓ Quiz Generator ready")
+        log.info("✓ Quiz Generator ready")
+    
+    def set_vector_store(self, vector_store: Chroma):
+        """Swap in an updated vector store, keeping the LLM client"""
+        self.vector_store = vector_store
     
     def generate_quiz(
         self, 
@@ -39,15 +47,11 @@ class QuizGenerator:
             difficulty: "easy", "medium", or "hard"
             k: Number of document chunks to retrieve
         """
-        print(f"\n{'='*50}")
-        print(f"Quiz Generation")
-        print(f"{'='*50}")
-        print(f"Topic: {topic}")
-        print(f"Questions: {num_questions}")
-        print(f"Difficulty: {difficulty}")
+        log.info("Quiz Generation - topic: %s, questions: %d, difficulty: %s",
+                 topic, num_questions, difficulty)
         
         # Retrieve relevant content
-        print("Searching for relevant content...")
+        log.info("Searching for relevant content...")
         relevant_docs = self.vector_store.similarity_search(topic, k=k)
         
         if not relevant_docs:
@@ -56,7 +60,7 @@ class QuizGenerator:
                 "questions": []
             }
         
-        print(f"✓ Found {len(relevant_docs)} relevant chunks")
+        log.info("✓ Found %d relevant chunks", len(relevant_docs))
         
         # Prepare context (limit to avoid token limits)
         context = "\n\n".join([doc.page_content for doc in relevant_docs[:8]])
@@ -70,12 +74,12 @@ class QuizGenerator:
         )
         
         # Generate quiz
-        print("Generating quiz questions...")
+        log.info("Generating quiz questions...")
         try:
             quiz_text = self.llm.invoke(prompt)
             
-            print("✓ Response received")
-            print("Parsing JSON...")
+            log.info("✓ Response received")
+            log.info("Parsing JSON...")
             
             # Clean up response - extract JSON
             quiz_text = self._extract_json(quiz_text)
@@ -95,18 +99,18 @@ class QuizGenerator:
                 "sources": list(set([doc.metadata.get('source', 'unknown') for doc in relevant_docs[:5]]))
             }
             
-            print(f"✓ Successfully generated {len(quiz_data['questions'])} questions")
+            log.info("✓ Successfully generated %d questions", len(quiz_data['questions']))
             return quiz_data
             
         except json.JSONDecodeError as e:
-            print(f"✗ JSON parsing failed: {str(e)}")
+            log.error("✗ JSON parsing failed: %s", e)
             return {
                 "error": f"Failed to parse quiz JSON: {str(e)}",
                 "raw_response": quiz_text if 'quiz_text' in locals() else "No response",
                 "questions": []
             }
         except Exception as e:
-            print(f"✗ Quiz generation failed: {str(e)}")
+            log.error("✗ Quiz generation failed: %s", e)
             return {
                 "error": f"Quiz generation failed: {str(e)}",
                 "questions": []
@@ -132,47 +136,72 @@ class QuizGenerator:
         
         return text.strip()
     
-    def grade_quiz(self, questions: List[Dict], user_answers: Dict[int, str]) -> Dict:
+    @staticmethod
+    def _align_answers(
+        num_questions: int,
+        user_answers: Union[Dict[int, str], List[str]],
+        question_indices: Optional[List[int]] = None
+    ) -> List[str]:
+        """Normalize submitted answers to a list indexed by question"""
+        if isinstance(user_answers, dict):
+            return [user_answers.get(idx, "") for idx in range(num_questions)]
+        
+        if question_indices is None:
+            answers = list(user_answers[:num_questions])
+            return answers + [""] * (num_questions - len(answers))
+        
+        aligned = [""] * num_questions
+        for idx, answer in zip(question_indices, user_answers):
+            if 0 <= idx < num_questions:
+                aligned[idx] = answer
+        return aligned
+    
+    def grade_quiz(
+        self,
+        questions: List[Dict],
+        user_answers: Union[Dict[int, str], List[str]],
+        question_indices: Optional[List[int]] = None
+    ) -> Dict:
         """
         Grade a quiz submission
         
         Args:
             questions: List of question dictionaries
-            user_answers: Dict mapping question index to answer (A/B/C/D)
+            user_answers: Answers (A/B/C/D), either a dict mapping question index
+                to answer or a list aligned with question_indices
+            question_indices: Question index for each entry of a list of answers;
+                if omitted, the list is aligned with the questions in order
         """
-        print(f"\n{'='*50}")
-        print("Grading Quiz")
-        print(f"{'='*50}")
+        log.info("Grading Quiz")
         
-        results = []
-        correct_count = 0
+        answers = [(answer or "").upper() for answer in
+                   self._align_answers(len(questions), user_answers, question_indices)]
+        correct_answers = [question.get("correct_answer", "").upper() for question in questions]
         
-        for idx, question in enumerate(questions):
-            user_answer = user_answers.get(idx, "").upper()
-            correct_answer = question.get("correct_answer", "").upper()
-            is_correct = user_answer == correct_answer
-            
-            if is_correct:
-                correct_count += 1
-            
-            results.append({
+        results = [
+            {
                 "question_number": idx + 1,
                 "question": question.get("question"),
-                "user_answer": user_answer if user_answer else "Not answered",
-                "correct_answer": correct_answer,
-                "is_correct": is_correct,
+                "user_answer": answers[idx] if answers[idx] else "Not answered",
+                "correct_answer": correct_answers[idx],
+                "is_correct": answers[idx] == correct_answers[idx],
                 "explanation": question.get("explanation", "")
-            })
+            }
+            for idx, question in enumerate(questions)
+        ]
+        correct_count = sum(result["is_correct"] for result in results)
+        incorrect = [result["question_number"] for result in results if not result["is_correct"]]
         
         score = (correct_count / len(questions)) * 100 if questions else 0
         
-        print(f"✓ Score: {score:.1f}% ({correct_count}/{len(questions)})")
+        log.info("✓ Score: %.1f%% (%d/%d)", score, correct_count, len(questions))
         
         return {
             "score": round(score, 1),
             "correct": correct_count,
             "total": len(questions),
             "percentage": f"{score:.1f}%",
+            "incorrect_questions": incorrect,
             "results": results
         }
 
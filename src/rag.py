@@ -1,20 +1,27 @@
-from typing import List, Dict, Optional
+import logging
+from typing import List, Dict, Optional, Iterator, Tuple
 from langchain_community.llms import Ollama
 from langchain_community.vectorstores import Chroma
 from src.prompts import (
     QA_PROMPT_TEMPLATE, 
     SUMMARIZATION_PROMPT_TEMPLATE, 
-    DEFINITION_EXTRACTION_PROMPT
+    DEFINITION_EXTRACTION_PROMPT,
+    DEFAULT_SUMMARY_QUERY,
+    DEFAULT_DEFINITIONS_QUERY
 )
 
 
+log = logging.getLogger(__name__)
+
+NO_ANSWER_MESSAGE = "I couldn't find relevant information in your study materials."
+NO_SUMMARY_MESSAGE = "No content found to summarize."
+
+
 class RAGSystem:
     """RAG-based Q&A system using Ollama"""
     
     def __init__(self, vector_store: Chroma, model_name: str = "llama3.2", temperature: float = 0.3):
-        self.vector_store = vector_store
-        
-        print(f"Initializing RAG with Ollama model: {model_name}")
+        log.info("Initializing RAG with Ollama model: %s", model_name)
         
         # Initialize Ollama LLM
         self.llm = Ollama(
@@ -24,31 +31,38 @@ class RAGSystem:
             num_predict=512,  # Max tokens to generate
         )
         
-        # Setup retriever
+        # Setup vector store and retriever
+        self.set_vector_store(vector_store)
+        
+        log.info("✓ RAG System ready")
+    
+    def set_vector_store(self, vector_store: Chroma):
+        """Swap in an updated vector store, keeping the LLM client"""
+        self.vector_store = vector_store
         self.retriever = vector_store.as_retriever(
             search_type="similarity",
             search_kwargs={"k": 5}
         )
-        
-        print("✓ RAG System ready")
     
-    def ask_question(self, question: str, k: int = 5) -> Dict:
-        """Answer a question using RAG"""
-        print(f"\n{'='*50}")
-        print(f"Question: {question}")
-        print(f"{'='*50}")
+    def _search(self, query: str, k: int, query_vec: Optional[List[float]] = None):
+        """Similarity search, reusing a precomputed query embedding when given"""
+        if query_vec is not None:
+            return self.vector_store.similarity_search_by_vector(query_vec, k=k)
+        return self.vector_store.similarity_search(query, k=k)
+    
+    def _prepare_question(self, question: str, k: int,
+                          query_vec: Optional[List[float]] = None) -> Tuple[Optional[str], List[Dict]]:
+        """Retrieve context for a question and build the QA prompt and sources"""
+        log.info("Question: %s", question)
         
         # Retrieve relevant documents
-        print("Searching for relevant content...")
-        relevant_docs = self.vector_store.similarity_search(question, k=k)
+        log.info("Searching for relevant content...")
+        relevant_docs = self._search(question, k, query_vec)
         
         if not relevant_docs:
-            return {
-                "answer": "I couldn't find relevant information in your study materials.",
-                "sources": []
-            }
+            return None, []
         
-        print(f"✓ Found {len(relevant_docs)} relevant chunks")
+        log.info("✓ Found %d relevant chunks", len(relevant_docs))
         
         # Prepare context
         context = "\n\n".join([
@@ -59,12 +73,6 @@ class RAGSystem:
         # Create prompt
         prompt = QA_PROMPT_TEMPLATE.format(context=context, question=question)
         
-        # Get answer from Ollama
-        print("Generating answer...")
-        answer = self.llm.invoke(prompt)
-        
-        print("✓ Answer generated")
-        
         # Prepare sources
         sources = [
             {
@@ -75,32 +83,62 @@ class RAGSystem:
             for doc in relevant_docs
         ]
         
+        return prompt, sources
+    
+    def ask_question(self, question: str, k: int = 5, query_vec: Optional[List[float]] = None) -> Dict:
+        """Answer a question using RAG"""
+        prompt, sources = self._prepare_question(question, k, query_vec)
+        
+        if prompt is None:
+            return {
+                "answer": NO_ANSWER_MESSAGE,
+                "sources": []
+            }
+        
+        # Get answer from Ollama
+        log.info("Generating answer...")
+        answer = self.llm.invoke(prompt)
+        
+        log.info("✓ Answer generated")
+        
         return {
             "answer": answer,
             "sources": sources
         }
     
-    def summarize(self, query: str = None, summary_type: str = "bullets", k: int = 10) -> Dict:
-        """Summarize content from the knowledge base"""
-        print(f"\n{'='*50}")
-        print(f"Summarization Request: {summary_type}")
-        print(f"{'='*50}")
+    def ask_question_stream(self, question: str, k: int = 5,
+                            query_vec: Optional[List[float]] = None) -> Iterator[Dict]:
+        """Answer a question using RAG, yielding the sources and then answer tokens"""
+        prompt, sources = self._prepare_question(question, k, query_vec)
+        yield {"sources": sources}
+        
+        if prompt is None:
+            yield {"token": NO_ANSWER_MESSAGE}
+            return
+        
+        log.info("Streaming answer...")
+        for token in self.llm.stream(prompt):
+            yield {"token": token}
+        
+        log.info("✓ Answer streamed")
+    
+    def _prepare_summary(self, query: Optional[str], summary_type: str, k: int,
+                         query_vec: Optional[List[float]] = None) -> Tuple[Optional[str], List[str]]:
+        """Retrieve content to summarize and build the summary prompt and sources"""
+        log.info("Summarization Request: %s", summary_type)
         
         if query:
-            print(f"Topic: {query}")
-            relevant_docs = self.vector_store.similarity_search(query, k=k)
+            log.info("Topic: %s", query)
+            relevant_docs = self._search(query, k, query_vec)
         else:
-            print("Generating general summary")
+            log.info("Generating general summary")
             # Get diverse chunks for general summary
-            relevant_docs = self.vector_store.similarity_search("overview main concepts key topics", k=k)
+            relevant_docs = self._search(DEFAULT_SUMMARY_QUERY, k, query_vec)
         
         if not relevant_docs:
-            return {
-                "summary": "No content found to summarize.",
-                "sources": []
-            }
+            return None, []
         
-        print(f"✓ Found {len(relevant_docs)} relevant chunks")
+        log.info("✓ Found %d relevant chunks", len(relevant_docs))
         
         # Prepare context
         context = "\n\n".join([doc.page_content for doc in relevant_docs])
@@ -111,27 +149,55 @@ class RAGSystem:
             summary_type=summary_type
         )
         
+        # Prepare sources
+        sources = list(set([doc.metadata.get('source', 'unknown') for doc in relevant_docs]))
+        
+        return prompt, sources
+    
+    def summarize(self, query: str = None, summary_type: str = "bullets", k: int = 10,
+                  query_vec: Optional[List[float]] = None) -> Dict:
+        """Summarize content from the knowledge base"""
+        prompt, sources = self._prepare_summary(query, summary_type, k, query_vec)
+        
+        if prompt is None:
+            return {
+                "summary": NO_SUMMARY_MESSAGE,
+                "sources": []
+            }
+        
         # Generate summary
-        print("Generating summary...")
+        log.info("Generating summary...")
         summary = self.llm.invoke(prompt)
         
-        print("✓ Summary generated")
-        
-        # Prepare sources
-        sources = list(set([doc.metadata.get('source', 'unknown') for doc in relevant_docs]))
+        log.info("✓ Summary generated")
         
         return {
             "summary": summary,
             "sources": sources
         }
     
-    def extract_definitions(self, query: str = "definitions terms concepts", k: int = 10) -> Dict:
+    def summarize_stream(self, query: str = None, summary_type: str = "bullets", k: int = 10,
+                         query_vec: Optional[List[float]] = None) -> Iterator[Dict]:
+        """Summarize content, yielding the sources and then summary tokens"""
+        prompt, sources = self._prepare_summary(query, summary_type, k, query_vec)
+        yield {"sources": sources}
+        
+        if prompt is None:
+            yield {"token": NO_SUMMARY_MESSAGE}
+            return
+        
+        log.info("Streaming summary...")
+        for token in self.llm.stream(prompt):
+            yield {"token": token}
+        
+        log.info("✓ Summary streamed")
+    
+    def extract_definitions(self, query: str = DEFAULT_DEFINITIONS_QUERY, k: int = 10,
+                            query_vec: Optional[List[float]] = None) -> Dict:
         """Extract key definitions from content"""
-        print(f"\n{'='*50}")
-        print("Extracting Definitions")
-        print(f"{'='*50}")
+        log.info("Extracting Definitions")
         
-        relevant_docs = self.vector_store.similarity_search(query, k=k)
+        relevant_docs = self._search(query, k, query_vec)
         
         if not relevant_docs:
             return {
@@ -139,15 +205,15 @@ class RAGSystem:
                 "sources": []
             }
         
-        print(f"✓ Found {len(relevant_docs)} relevant chunks")
+        log.info("✓ Found %d relevant chunks", len(relevant_docs))
         
         context = "\n\n".join([doc.page_content for doc in relevant_docs])
         prompt = DEFINITION_EXTRACTION_PROMPT.format(context=context[:4000])
         
-        print("Extracting definitions...")
+        log.info("Extracting definitions...")
         definitions = self.llm.invoke(prompt)
         
-        print("✓ Definitions extracted")
+        log.info("✓ Definitions extracted")
         
         sources = list(set([doc.metadata.get('source', 'unknown') for doc in relevant_docs]))
         
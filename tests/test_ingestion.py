@@ -0,0 +1,62 @@
+import sys
+import os
+import hashlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb.api.client
+from chromadb.api.models.Collection import Collection
+from langchain_community.embeddings import ollama as ollama_embeddings
+from langchain_core.documents import Document
+
+from src.ingestion import DocumentIngestion
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, prompt: str):
+        digest = hashlib.sha256(prompt.encode()).digest()
+        self.embedding = [b / 255.0 for b in digest[:8]]
+
+    def json(self):
+        return {"embedding": self.embedding}
+
+
+def fake_post(url, headers=None, json=None, **kwargs):
+    """Stand-in for Ollama's /api/embeddings: a deterministic vector per prompt"""
+    assert url.endswith("/api/embeddings")
+    return FakeResponse(json["prompt"])
+
+
+def test_embed_batch_matches_embed_documents(monkeypatch):
+    """Batched embeddings are the vectors LangChain would store for each chunk"""
+    monkeypatch.setattr(ollama_embeddings.requests, "post", fake_post)
+    ingestion = DocumentIngestion()
+    texts = [f"chunk number {i}" for i in range(10)]
+
+    assert ingestion.embed_batch(texts, batch_size=3) == ingestion.embeddings.embed_documents(texts)
+
+
+def test_pre_embedded_documents_respect_max_batch_size(monkeypatch, tmp_path):
+    """Inserts are split so no single add exceeds chromadb's max batch size"""
+    monkeypatch.setattr(ollama_embeddings.requests, "post", fake_post)
+    monkeypatch.setattr(chromadb.api.client.Client, "get_max_batch_size", lambda self: 2)
+    batch_sizes = []
+    original_add = Collection.add
+
+    def recording_add(self, ids, **kwargs):
+        batch_sizes.append(len(ids))
+        return original_add(self, ids=ids, **kwargs)
+
+    monkeypatch.setattr(Collection, "add", recording_add)
+    ingestion = DocumentIngestion(vector_store_path=str(tmp_path))
+    documents = [
+        Document(page_content=f"chunk number {i}", metadata={"source": "notes.txt"})
+        for i in range(5)
+    ]
+    embeddings = ingestion.embed_batch([doc.page_content for doc in documents])
+
+    vector_store = ingestion.create_vector_store(documents, "batched", embeddings=embeddings)
+
+    assert batch_sizes == [2, 2, 1]
+    assert vector_store._collection.count() == 5
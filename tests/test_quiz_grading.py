@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.quiz_generator import QuizGenerator
+
+
+QUESTIONS = [
+    {"question": f"Question {i}", "correct_answer": answer, "explanation": ""}
+    for i, answer in enumerate(["A", "B", "C", "D"])
+]
+
+
+def grade(user_answers, question_indices=None):
+    return QuizGenerator(vector_store=None).grade_quiz(QUESTIONS, user_answers, question_indices)
+
+
+def test_list_in_question_order():
+    """A plain list is aligned with the questions in order"""
+    results = grade(["a", "B", "D", "D"])
+
+    assert results["correct"] == 3
+    assert results["score"] == 75.0
+    assert results["incorrect_questions"] == [3]
+    assert [r["user_answer"] for r in results["results"]] == ["A", "B", "D", "D"]
+
+
+def test_short_list_is_padded_as_unanswered():
+    """Questions past the end of a short list count as not answered"""
+    results = grade(["A", "B"])
+
+    assert results["correct"] == 2
+    assert results["incorrect_questions"] == [3, 4]
+    assert results["results"][3]["user_answer"] == "Not answered"
+
+
+def test_question_indices_skip_out_of_range_and_keep_last_duplicate():
+    """Out-of-range indices are ignored; a repeated index keeps its last answer"""
+    results = grade(["D", "A", "X", "C"], question_indices=[3, 0, 7, 0])
+
+    assert [r["user_answer"] for r in results["results"]] == ["C", "Not answered", "Not answered", "D"]
+    assert results["correct"] == 1
+    assert results["incorrect_questions"] == [1, 2, 3]
+
+
+def test_legacy_dict_answers():
+    """Answers keyed by question index still grade"""
+    results = grade({0: "A", 2: "C"})
+
+    assert results["correct"] == 2
+    assert results["incorrect_questions"] == [2, 4]
+
+
+def test_api_rejects_mismatched_question_indices(monkeypatch):
+    """The grading endpoint returns 400 when indices and answers differ in length"""
+    monkeypatch.setattr(api_main, "quiz_generator", QuizGenerator(vector_store=None))
+    monkeypatch.setitem(api_main.quiz_cache, "quiz-1", QUESTIONS)
+    client = TestClient(api_main.app)
+
+    response = client.post("/quiz/grade", json={
+        "quiz_id": "quiz-1",
+        "answers": ["A", "B"],
+        "question_indices": [0]
+    })
+    assert response.status_code == 400
+
+    response = client.post("/quiz/grade", json={
+        "quiz_id": "quiz-1",
+        "answers": ["A", "B"],
+        "question_indices": [0, 1]
+    })
+    assert response.status_code == 200
+    assert response.json()["incorrect_questions"] == [3, 4]
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from api.semantic_cache import SemanticCache, quantize
+
+
+def random_vectors(n: int, dim: int = 32, seed: int = 1) -> np.ndarray:
+    """Random unit vectors that are far apart from each other"""
+    rng = np.random.default_rng(seed)
+    vecs = rng.standard_normal((n, dim)).astype(np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+def test_hit_on_same_direction():
+    """A query pointing the same way as a cached one is a hit"""
+    vec = random_vectors(1)[0]
+    cache = SemanticCache(dim=vec.shape[0])
+    cache.put(vec, {"answer": "cached"})
+
+    assert cache.get(vec * 3.0) == {"answer": "cached"}
+    assert cache.get(-vec) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_hit_on_near_neighbour():
+    """Paraphrase-level neighbours (cosine 0.97) hit despite LSH bucketing"""
+    dim = 768
+    for seed in range(20):
+        a, noise = random_vectors(2, dim=dim, seed=seed)
+        orth = noise - (noise @ a) * a
+        orth /= np.linalg.norm(orth)
+        near = 0.97 * a + np.sqrt(1 - 0.97 ** 2) * orth
+
+        cache = SemanticCache(dim=dim, seed=seed)
+        cache.put(a, "cached")
+        assert cache.get(near) == "cached"
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted when the cache is full"""
+    a, b, c = random_vectors(3)
+    cache = SemanticCache(dim=a.shape[0], capacity=2)
+    cache.put(a, "a")
+    cache.put(b, "b")
+
+    # Touch "a" so "b" becomes the eviction candidate
+    assert cache.get(a) == "a"
+    cache.put(c, "c")
+
+    assert len(cache) == 2
+    assert cache.get(a) == "a"
+    assert cache.get(b) is None
+    assert cache.get(c) == "c"
+
+
+def test_clear():
+    """Clearing drops every entry"""
+    vec = random_vectors(1)[0]
+    cache = SemanticCache(dim=vec.shape[0])
+    cache.put(vec, "value")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get(vec) is None
+
+
+def test_grows_past_initial_size():
+    """Storage doubles on demand until it reaches capacity"""
+    vecs = random_vectors(10, dim=64)
+    cache = SemanticCache(dim=64, capacity=8, initial_size=2)
+    for i, vec in enumerate(vecs):
+        cache.put(vec, i)
+
+    assert len(cache) == 8
+    # The two oldest entries were evicted
+    assert cache.get(vecs[0]) is None
+    assert cache.get(vecs[9]) == 9
+
+
+def test_numba_matches_numpy():
+    """JIT kernels pick the same buckets and hits as the NumPy path"""
+    vecs = random_vectors(20, dim=48)
+    fast = SemanticCache(dim=48, use_numba=True)
+    slow = SemanticCache(dim=48, use_numba=False)
+    for i, vec in enumerate(vecs):
+        assert np.array_equal(fast._hash(vec), slow._hash(vec))
+        fast.put(vec, i)
+        slow.put(vec, i)
+
+    for i, vec in enumerate(vecs):
+        assert fast.get(vec) == slow.get(vec) == i
+
+
+def test_quantized_scores_track_cosine():
+    """int8 storage keeps cosine similarity within a small tolerance"""
+    a, b = random_vectors(2, dim=768)
+    qa, sa = quantize(a)
+    qb, sb = quantize(b)
+
+    approx = float(qa.astype(np.int32) @ qb.astype(np.int32)) * sa * sb
+    assert qa.dtype == np.int8
+    assert abs(approx - float(a @ b)) < 0.01
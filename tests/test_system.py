@@ -177,6 +177,9 @@ def test_complete_pipeline():
 
 
 if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         test_complete_pipeline()
     except Exception as e: